@@ -5,349 +5,362 @@ FP-ASM Documentation HTML Generator
 Converts markdown documentation to a beautiful HTML wiki-style website.
 
 Usage:
-    python generate_html_docs.py
+    python generate_html_docs.py [--force]
+
+    Pages whose HTML is newer than both their markdown source and this
+    script are skipped; --force regenerates everything.
 
 Output:
-    Creates 'docs_html/' directory with all HTML files
+    Creates 'docs_html/' directory with all HTML files and their shared
+    styles.css
 """
 
 import re
 import os
+import sys
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# HTML Template
-HTML_TEMPLATE = """<!DOCTYPE html>
+# Stylesheet shared by all pages, written once to styles.css
+_CSS = """* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+    line-height: 1.6;
+    color: #333;
+    background: #f5f5f5;
+}
+
+.container {
+    display: flex;
+    max-width: 1400px;
+    margin: 0 auto;
+    background: white;
+    min-height: 100vh;
+}
+
+/* Sidebar Navigation */
+.sidebar {
+    width: 280px;
+    background: #2c3e50;
+    color: white;
+    padding: 20px;
+    position: sticky;
+    top: 0;
+    height: 100vh;
+    overflow-y: auto;
+}
+
+.sidebar h2 {
+    color: #3498db;
+    margin-bottom: 20px;
+    font-size: 1.4em;
+    border-bottom: 2px solid #3498db;
+    padding-bottom: 10px;
+}
+
+.sidebar nav ul {
+    list-style: none;
+}
+
+.sidebar nav li {
+    margin: 8px 0;
+}
+
+.sidebar nav a {
+    color: #ecf0f1;
+    text-decoration: none;
+    display: block;
+    padding: 8px 12px;
+    border-radius: 4px;
+    transition: all 0.3s;
+}
+
+.sidebar nav a:hover {
+    background: #34495e;
+    color: #3498db;
+    transform: translateX(5px);
+}
+
+.sidebar nav a.active {
+    background: #3498db;
+    color: white;
+}
+
+.sidebar .badge {
+    display: inline-block;
+    background: #27ae60;
+    color: white;
+    font-size: 0.7em;
+    padding: 2px 6px;
+    border-radius: 3px;
+    margin-left: 8px;
+}
+
+/* Main Content */
+.content {
+    flex: 1;
+    padding: 40px 60px;
+    overflow-y: auto;
+}
+
+.content h1 {
+    color: #2c3e50;
+    font-size: 2.5em;
+    margin-bottom: 20px;
+    border-bottom: 3px solid #3498db;
+    padding-bottom: 10px;
+}
+
+.content h2 {
+    color: #34495e;
+    font-size: 2em;
+    margin-top: 40px;
+    margin-bottom: 15px;
+    border-left: 4px solid #3498db;
+    padding-left: 15px;
+}
+
+.content h3 {
+    color: #34495e;
+    font-size: 1.5em;
+    margin-top: 30px;
+    margin-bottom: 10px;
+}
+
+.content h4 {
+    color: #7f8c8d;
+    font-size: 1.2em;
+    margin-top: 20px;
+    margin-bottom: 10px;
+}
+
+.content p {
+    margin: 15px 0;
+    line-height: 1.8;
+}
+
+.content ul, .content ol {
+    margin: 15px 0 15px 30px;
+}
+
+.content li {
+    margin: 8px 0;
+}
+
+/* Code Blocks */
+.content pre {
+    background: #2c3e50;
+    color: #ecf0f1;
+    padding: 20px;
+    border-radius: 6px;
+    overflow-x: auto;
+    margin: 20px 0;
+    border-left: 4px solid #3498db;
+}
+
+.content code {
+    background: #ecf0f1;
+    padding: 2px 6px;
+    border-radius: 3px;
+    font-family: 'Courier New', monospace;
+    font-size: 0.9em;
+    color: #c7254e;
+}
+
+.content pre code {
+    background: transparent;
+    padding: 0;
+    color: #ecf0f1;
+}
+
+/* Tables */
+.content table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 20px 0;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+
+.content th {
+    background: #3498db;
+    color: white;
+    padding: 12px;
+    text-align: left;
+    font-weight: bold;
+}
+
+.content td {
+    padding: 12px;
+    border-bottom: 1px solid #ecf0f1;
+}
+
+.content tr:hover {
+    background: #f8f9fa;
+}
+
+/* Badges */
+.badge-green {
+    background: #27ae60;
+    color: white;
+    padding: 4px 10px;
+    border-radius: 4px;
+    font-size: 0.85em;
+    font-weight: bold;
+}
+
+.badge-blue {
+    background: #3498db;
+    color: white;
+    padding: 4px 10px;
+    border-radius: 4px;
+    font-size: 0.85em;
+    font-weight: bold;
+}
+
+.badge-orange {
+    background: #e67e22;
+    color: white;
+    padding: 4px 10px;
+    border-radius: 4px;
+    font-size: 0.85em;
+    font-weight: bold;
+}
+
+/* Blockquotes */
+.content blockquote {
+    border-left: 4px solid #3498db;
+    padding: 15px 20px;
+    background: #ecf0f1;
+    margin: 20px 0;
+    font-style: italic;
+}
+
+/* Links */
+.content a {
+    color: #3498db;
+    text-decoration: none;
+    border-bottom: 1px solid transparent;
+    transition: border-color 0.3s;
+}
+
+.content a:hover {
+    border-bottom-color: #3498db;
+}
+
+/* Horizontal Rules */
+.content hr {
+    border: none;
+    border-top: 2px solid #ecf0f1;
+    margin: 40px 0;
+}
+
+/* Emoji support */
+.emoji {
+    font-size: 1.2em;
+}
+
+/* Top banner */
+.banner {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 20px 60px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+
+.banner h1 {
+    color: white;
+    border: none;
+    margin: 0;
+    font-size: 1.8em;
+}
+
+.banner p {
+    margin: 5px 0 0 0;
+    opacity: 0.9;
+}
+
+/* Function signature boxes */
+.signature {
+    background: #f8f9fa;
+    border: 2px solid #3498db;
+    border-radius: 6px;
+    padding: 15px;
+    margin: 20px 0;
+    font-family: 'Courier New', monospace;
+}
+
+/* Performance badges */
+.perf-badge {
+    display: inline-block;
+    padding: 6px 12px;
+    border-radius: 20px;
+    font-size: 0.85em;
+    font-weight: bold;
+    margin: 5px 5px 5px 0;
+}
+
+.perf-excellent { background: #27ae60; color: white; }
+.perf-good { background: #2ecc71; color: white; }
+.perf-okay { background: #f39c12; color: white; }
+.perf-competitive { background: #3498db; color: white; }
+
+/* Scrollbar styling */
+::-webkit-scrollbar {
+    width: 10px;
+}
+
+::-webkit-scrollbar-track {
+    background: #f1f1f1;
+}
+
+::-webkit-scrollbar-thumb {
+    background: #888;
+    border-radius: 5px;
+}
+
+::-webkit-scrollbar-thumb:hover {
+    background: #555;
+}
+
+@media (max-width: 768px) {
+    .container {
+        flex-direction: column;
+    }
+
+    .sidebar {
+        width: 100%;
+        height: auto;
+        position: relative;
+    }
+
+    .content {
+        padding: 20px;
+    }
+
+    .banner {
+        padding: 15px 20px;
+    }
+}
+"""
+
+# HTML Template, split so that only the small body fragment goes through
+# str.format
+_HTML_PREFIX = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - FP-ASM Library</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f5f5f5;
-        }}
-
-        .container {{
-            display: flex;
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            min-height: 100vh;
-        }}
-
-        /* Sidebar Navigation */
-        .sidebar {{
-            width: 280px;
-            background: #2c3e50;
-            color: white;
-            padding: 20px;
-            position: sticky;
-            top: 0;
-            height: 100vh;
-            overflow-y: auto;
-        }}
-
-        .sidebar h2 {{
-            color: #3498db;
-            margin-bottom: 20px;
-            font-size: 1.4em;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 10px;
-        }}
-
-        .sidebar nav ul {{
-            list-style: none;
-        }}
-
-        .sidebar nav li {{
-            margin: 8px 0;
-        }}
-
-        .sidebar nav a {{
-            color: #ecf0f1;
-            text-decoration: none;
-            display: block;
-            padding: 8px 12px;
-            border-radius: 4px;
-            transition: all 0.3s;
-        }}
-
-        .sidebar nav a:hover {{
-            background: #34495e;
-            color: #3498db;
-            transform: translateX(5px);
-        }}
-
-        .sidebar nav a.active {{
-            background: #3498db;
-            color: white;
-        }}
-
-        .sidebar .badge {{
-            display: inline-block;
-            background: #27ae60;
-            color: white;
-            font-size: 0.7em;
-            padding: 2px 6px;
-            border-radius: 3px;
-            margin-left: 8px;
-        }}
-
-        /* Main Content */
-        .content {{
-            flex: 1;
-            padding: 40px 60px;
-            overflow-y: auto;
-        }}
-
-        .content h1 {{
-            color: #2c3e50;
-            font-size: 2.5em;
-            margin-bottom: 20px;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-
-        .content h2 {{
-            color: #34495e;
-            font-size: 2em;
-            margin-top: 40px;
-            margin-bottom: 15px;
-            border-left: 4px solid #3498db;
-            padding-left: 15px;
-        }}
-
-        .content h3 {{
-            color: #34495e;
-            font-size: 1.5em;
-            margin-top: 30px;
-            margin-bottom: 10px;
-        }}
-
-        .content h4 {{
-            color: #7f8c8d;
-            font-size: 1.2em;
-            margin-top: 20px;
-            margin-bottom: 10px;
-        }}
-
-        .content p {{
-            margin: 15px 0;
-            line-height: 1.8;
-        }}
-
-        .content ul, .content ol {{
-            margin: 15px 0 15px 30px;
-        }}
-
-        .content li {{
-            margin: 8px 0;
-        }}
-
-        /* Code Blocks */
-        .content pre {{
-            background: #2c3e50;
-            color: #ecf0f1;
-            padding: 20px;
-            border-radius: 6px;
-            overflow-x: auto;
-            margin: 20px 0;
-            border-left: 4px solid #3498db;
-        }}
-
-        .content code {{
-            background: #ecf0f1;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.9em;
-            color: #c7254e;
-        }}
-
-        .content pre code {{
-            background: transparent;
-            padding: 0;
-            color: #ecf0f1;
-        }}
-
-        /* Tables */
-        .content table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-
-        .content th {{
-            background: #3498db;
-            color: white;
-            padding: 12px;
-            text-align: left;
-            font-weight: bold;
-        }}
-
-        .content td {{
-            padding: 12px;
-            border-bottom: 1px solid #ecf0f1;
-        }}
-
-        .content tr:hover {{
-            background: #f8f9fa;
-        }}
-
-        /* Badges */
-        .badge-green {{
-            background: #27ae60;
-            color: white;
-            padding: 4px 10px;
-            border-radius: 4px;
-            font-size: 0.85em;
-            font-weight: bold;
-        }}
-
-        .badge-blue {{
-            background: #3498db;
-            color: white;
-            padding: 4px 10px;
-            border-radius: 4px;
-            font-size: 0.85em;
-            font-weight: bold;
-        }}
-
-        .badge-orange {{
-            background: #e67e22;
-            color: white;
-            padding: 4px 10px;
-            border-radius: 4px;
-            font-size: 0.85em;
-            font-weight: bold;
-        }}
-
-        /* Blockquotes */
-        .content blockquote {{
-            border-left: 4px solid #3498db;
-            padding: 15px 20px;
-            background: #ecf0f1;
-            margin: 20px 0;
-            font-style: italic;
-        }}
-
-        /* Links */
-        .content a {{
-            color: #3498db;
-            text-decoration: none;
-            border-bottom: 1px solid transparent;
-            transition: border-color 0.3s;
-        }}
-
-        .content a:hover {{
-            border-bottom-color: #3498db;
-        }}
-
-        /* Horizontal Rules */
-        .content hr {{
-            border: none;
-            border-top: 2px solid #ecf0f1;
-            margin: 40px 0;
-        }}
-
-        /* Emoji support */
-        .emoji {{
-            font-size: 1.2em;
-        }}
-
-        /* Top banner */
-        .banner {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px 60px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-
-        .banner h1 {{
-            color: white;
-            border: none;
-            margin: 0;
-            font-size: 1.8em;
-        }}
-
-        .banner p {{
-            margin: 5px 0 0 0;
-            opacity: 0.9;
-        }}
-
-        /* Function signature boxes */
-        .signature {{
-            background: #f8f9fa;
-            border: 2px solid #3498db;
-            border-radius: 6px;
-            padding: 15px;
-            margin: 20px 0;
-            font-family: 'Courier New', monospace;
-        }}
-
-        /* Performance badges */
-        .perf-badge {{
-            display: inline-block;
-            padding: 6px 12px;
-            border-radius: 20px;
-            font-size: 0.85em;
-            font-weight: bold;
-            margin: 5px 5px 5px 0;
-        }}
-
-        .perf-excellent {{ background: #27ae60; color: white; }}
-        .perf-good {{ background: #2ecc71; color: white; }}
-        .perf-okay {{ background: #f39c12; color: white; }}
-        .perf-competitive {{ background: #3498db; color: white; }}
-
-        /* Scrollbar styling */
-        ::-webkit-scrollbar {{
-            width: 10px;
-        }}
-
-        ::-webkit-scrollbar-track {{
-            background: #f1f1f1;
-        }}
-
-        ::-webkit-scrollbar-thumb {{
-            background: #888;
-            border-radius: 5px;
-        }}
-
-        ::-webkit-scrollbar-thumb:hover {{
-            background: #555;
-        }}
-
-        @media (max-width: 768px) {{
-            .container {{
-                flex-direction: column;
-            }}
-
-            .sidebar {{
-                width: 100%;
-                height: auto;
-                position: relative;
-            }}
-
-            .content {{
-                padding: 20px;
-            }}
-
-            .banner {{
-                padding: 15px 20px;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="styles.css">
+"""
+
+_HTML_BODY_TMPL = """    <title>{title} - FP-ASM Library</title>
 </head>
 <body>
     <div class="banner">
@@ -355,123 +368,233 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         <p>Complete Functional Programming Toolkit for C • 100% FP Coverage • 36 Functions • Production Ready</p>
     </div>
     <div class="container">
-        <aside class="sidebar">
+{sidebar}
+        <main class="content">
+            {content}
+"""
+
+_SIDEBAR_TMPL = """        <aside class="sidebar">
             <h2>📚 Documentation</h2>
             <nav>
                 <ul>
-                    <li><a href="index.html" class="{active_index}">🏠 Home</a></li>
-                    <li><a href="README.html" class="{active_readme}">📖 Overview</a></li>
-                    <li><a href="QUICK_START.html" class="{active_quick}">🚀 Quick Start</a></li>
-                    <li><a href="API_REFERENCE.html" class="{active_api}">📘 API Reference <span class="badge">36 funcs</span></a></li>
-                    <li><a href="COMPLETE_LIBRARY_REPORT.html" class="{active_complete}">🎉 Journey Report</a></li>
-                    <li><a href="TIER1_COMPLETENESS_REPORT.html" class="{active_tier1}">📊 TIER 1 Report</a></li>
-                    <li><a href="TIER2_COMPLETENESS_REPORT.html" class="{active_tier2}">📊 TIER 2 Report</a></li>
-                    <li><a href="TIER3_COMPLETENESS_REPORT.html" class="{active_tier3}">📊 TIER 3 Report</a></li>
-                    <li><a href="ACHIEVEMENT_SUMMARY.html" class="{active_achievement}">🏆 Achievement</a></li>
+                    <li><a href="index.html" class="__ACT_index__">🏠 Home</a></li>
+                    <li><a href="README.html" class="__ACT_readme__">📖 Overview</a></li>
+                    <li><a href="QUICK_START.html" class="__ACT_quick__">🚀 Quick Start</a></li>
+                    <li><a href="API_REFERENCE.html" class="__ACT_api__">📘 API Reference <span class="badge">36 funcs</span></a></li>
+                    <li><a href="COMPLETE_LIBRARY_REPORT.html" class="__ACT_complete__">🎉 Journey Report</a></li>
+                    <li><a href="TIER1_COMPLETENESS_REPORT.html" class="__ACT_tier1__">📊 TIER 1 Report</a></li>
+                    <li><a href="TIER2_COMPLETENESS_REPORT.html" class="__ACT_tier2__">📊 TIER 2 Report</a></li>
+                    <li><a href="TIER3_COMPLETENESS_REPORT.html" class="__ACT_tier3__">📊 TIER 3 Report</a></li>
+                    <li><a href="ACHIEVEMENT_SUMMARY.html" class="__ACT_achievement__">🏆 Achievement</a></li>
                 </ul>
             </nav>
-        </aside>
-        <main class="content">
-            {content}
-        </main>
+        </aside>"""
+
+_HTML_SUFFIX = """        </main>
     </div>
 </body>
 </html>
 """
 
-def convert_markdown_to_html(markdown_text):
-    """Convert markdown to HTML with basic formatting."""
-    html = markdown_text
-
-    # Headers
-    html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-    html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-    html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-    html = re.sub(r'^#### (.+)$', r'<h4>\1</h4>', html, flags=re.MULTILINE)
-
-    # Code blocks
-    html = re.sub(r'```(\w+)?\n(.*?)```', r'<pre><code>\2</code></pre>', html, flags=re.DOTALL)
-
-    # Inline code
-    html = re.sub(r'`([^`]+)`', r'<code>\1</code>', html)
-
-    # Bold
-    html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
+# Sidebar markers left over once the active page's marker is replaced
+_ACTIVE_MARKER_RE = re.compile(r'__ACT_[a-z0-9]+__')
+
+# Sidebar entry highlighted on each generated page
+PAGE_KEYS = {
+    "README.md": "readme",
+    "QUICK_START.md": "quick",
+    "API_REFERENCE.md": "api",
+    "COMPLETE_LIBRARY_REPORT.md": "complete",
+    "TIER1_COMPLETENESS_REPORT.md": "tier1",
+    "TIER2_COMPLETENESS_REPORT.md": "tier2",
+    "TIER3_COMPLETENESS_REPORT.md": "tier3",
+    "ACHIEVEMENT_SUMMARY.md": "achievement",
+}
 
-    # Italic
-    html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
+# Sidebar for each page key, rendered once at import ('' highlights nothing)
+_SIDEBARS = {
+    key: _ACTIVE_MARKER_RE.sub('', _SIDEBAR_TMPL.replace(f'__ACT_{key}__', 'active'))
+    for key in ('', 'index', *PAGE_KEYS.values())
+}
 
-    # Links
-    html = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'<a href="\2">\1</a>', html)
+def render_page(title, content, page_key):
+    """Fill the page template, marking `page_key` active in the sidebar."""
+    return _HTML_PREFIX + _HTML_BODY_TMPL.format(
+        title=title,
+        sidebar=_SIDEBARS.get(page_key, _SIDEBARS['']),
+        content=content
+    ) + _HTML_SUFFIX
+
+_TABLE_RE = re.compile(r'\|[^\n]+\|\n\|[-:\| ]+\|\n(\|[^\n]+\|\n)+')
+
+# Line prefixes that open and close block elements when wrapping paragraphs
+_BLOCK_OPEN = ('<h', '<pre>', '<ul>', '<ol>', '<table>', '<hr>', '<li>')
+_BLOCK_CLOSE = ('</pre>', '</ul>', '</ol>', '</table>')
+
+_EMOJI_RE = re.compile(r'[\U0001F300-\U0001F9FF\u2600-\u27BF]')
+
+def _inline(text):
+    """Apply the inline rules to the text of a block element."""
+    # Most headers and list items carry no inline markup; plain substring
+    # tests are far cheaper than running the regex over them
+    if '`' not in text and '*' not in text and '[' not in text:
+        return text
+    return _INLINE_RE.sub(_dispatch, text)
+
+def _header(level, text):
+    """Render a header of the given level."""
+    return f'<h{level}>{_inline(text)}</h{level}>'
+
+def _link(href, text):
+    """Render a link, pointing links to markdown docs at their HTML pages."""
+    if href.endswith('.md'):
+        href = href[:-3] + '.html'
+    return f'<a href="{href}">{_inline(text)}</a>'
+
+# Markdown rules as (name, pattern, handler), highest priority first. All rules
+# are combined into one alternation, and at each position the first rule that
+# matches wins: fenced code shields its body from every other rule, inline
+# code shields its contents, and bold wins over italic (italic may wrap bold
+# spans but never ends on the first '*' of a '**').
+_BLOCK_RULES = [
+    ('code', r'```(?:\w+)?\n(?P<code_text>(?s:.*?))```',
+     lambda m: f"<pre><code>{m.group('code_text')}</code></pre>"),
+    ('header', r'^(?P<header_level>#{1,4}) (?P<header_text>.+)$',
+     lambda m: _header(len(m.group('header_level')), m.group('header_text'))),
+    ('hr', r'^---+$',
+     lambda m: '<hr>'),
+    ('item', r'^- (?P<item_text>.+)$',
+     lambda m: f"<li>{_inline(m.group('item_text'))}</li>"),
+    ('numbered', r'^\d+\. (?P<numbered_text>.+)$',
+     lambda m: f"<li>{_inline(m.group('numbered_text'))}</li>"),
+]
+
+_INLINE_RULES = [
+    ('inline', r'`(?P<inline_text>[^`]+)`',
+     lambda m: f"<code>{m.group('inline_text')}</code>"),
+    ('bold', r'\*\*(?P<bold_text>.+?)\*\*',
+     lambda m: f"<strong>{_inline(m.group('bold_text'))}</strong>"),
+    ('italic', r'\*(?P<italic_text>(?:\*\*.+?\*\*|[^*\n])+)\*(?!\*)',
+     lambda m: f"<em>{_inline(m.group('italic_text'))}</em>"),
+    ('link', r'\[(?P<link_text>[^\]]+)\]\((?P<link_href>[^\)]+)\)',
+     lambda m: _link(m.group('link_href'), m.group('link_text'))),
+]
+
+def _alternation(rules):
+    """Join rules into one regex alternation with a named group per rule."""
+    return '|'.join(f'(?P<{name}>{pattern})' for name, pattern, _ in rules)
+
+# Every rule starts with one of these characters, so the leading lookahead
+# lets most positions fail on one character-class test
+_MARKDOWN_RE = re.compile(
+    r'(?=[`*\[#\-\d])(?:' + _alternation(_BLOCK_RULES + _INLINE_RULES) + ')',
+    re.MULTILINE)
+
+_INLINE_RE = re.compile(_alternation(_INLINE_RULES))
+
+_HANDLERS = {name: handler for name, _, handler in _BLOCK_RULES + _INLINE_RULES}
+
+def _dispatch(match):
+    """Replace one markdown match using the handler for its rule."""
+    return _HANDLERS[match.lastgroup](match)
+
+def _convert_table(match):
+    """Render a matched markdown table as an HTML table."""
+    lines = match.group(0).split('\n')
+    if len(lines) < 3:
+        return match.group(0)
+
+    # Header
+    parts = ['<table>\n<tr>']
+    parts.extend(f'<th>{h.strip()}</th>' for h in lines[0].split('|')[1:-1])
+    parts.append('</tr>\n')
+
+    # Rows (skip separator line)
+    for line in lines[2:]:
+        if line.strip():
+            parts.append('<tr>')
+            parts.extend(f'<td>{c.strip()}</td>' for c in line.split('|')[1:-1])
+            parts.append('</tr>\n')
+
+    parts.append('</table>')
+    return ''.join(parts)
+
+def _chunks(markdown_text):
+    """Split markdown into blank-line separated chunks, keeping code fences whole."""
+    pending = []
+    fences = 0
+    for part in markdown_text.split('\n\n'):
+        pending.append(part)
+        fences += part.count('```')
+        if fences % 2 == 0:
+            yield '\n\n'.join(pending) + '\n'
+            pending = []
+    if pending:
+        yield '\n\n'.join(pending) + '\n'
 
-    # Horizontal rules
-    html = re.sub(r'^---+$', r'<hr>', html, flags=re.MULTILINE)
+def convert_markdown_to_html(markdown_text):
+    """Convert markdown to HTML with basic formatting.
 
-    # Lists (simple)
-    html = re.sub(r'^\- (.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
-    html = re.sub(r'(<li>.*</li>)', r'<ul>\1</ul>', html, flags=re.DOTALL)
+    Paragraphs never span a blank line, so the text is converted one chunk
+    at a time; every pass then works on a small string that stays in cache.
+    """
+    return '\n\n'.join(map(_convert_chunk, _chunks(markdown_text)))
 
-    # Numbered lists
-    html = re.sub(r'^\d+\. (.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
+def _convert_chunk(markdown_text):
+    """Convert one chunk of markdown to HTML."""
+    html = _MARKDOWN_RE.sub(_dispatch, markdown_text)
 
     # Tables (basic)
-    def convert_table(match):
-        lines = match.group(0).split('\n')
-        if len(lines) < 3:
-            return match.group(0)
-
-        table = '<table>\n'
-
-        # Header
-        headers = [h.strip() for h in lines[0].split('|')[1:-1]]
-        table += '<tr>'
-        for h in headers:
-            table += f'<th>{h}</th>'
-        table += '</tr>\n'
-
-        # Rows (skip separator line)
-        for line in lines[2:]:
-            if line.strip():
-                cells = [c.strip() for c in line.split('|')[1:-1]]
-                table += '<tr>'
-                for c in cells:
-                    table += f'<td>{c}</td>'
-                table += '</tr>\n'
-
-        table += '</table>'
-        return table
-
-    html = re.sub(r'\|[^\n]+\|\n\|[-:\| ]+\|\n(\|[^\n]+\|\n)+', convert_table, html)
-
-    # Paragraphs
-    lines = html.split('\n')
-    in_block = False
+    html = _TABLE_RE.sub(_convert_table, html)
+
+    # Lists and paragraphs
     result = []
+    append = result.append
+    in_block = False
+    in_list = False
 
-    for line in lines:
-        stripped = line.strip()
+    for line in html.splitlines():
+        stripped = line.lstrip()
 
-        if stripped.startswith(('<h', '<pre>', '<ul>', '<ol>', '<table>', '<hr>', '<li>')):
+        # Wrap each run of consecutive list items in one <ul>
+        if line.startswith('<li>') != in_list:
+            in_list = not in_list
+            append('<ul>' if in_list else '</ul>')
+            in_block = in_list
+
+        if stripped.startswith(_BLOCK_OPEN):
             in_block = True
-            result.append(line)
-        elif stripped.startswith(('</pre>', '</ul>', '</ol>', '</table>')):
+        elif stripped.startswith(_BLOCK_CLOSE):
             in_block = False
-            result.append(line)
-        elif stripped == '':
-            result.append(line)
-        elif not in_block and stripped and not stripped.startswith('<'):
-            result.append(f'<p>{line}</p>')
-        else:
-            result.append(line)
+        elif stripped and not in_block and stripped[0] != '<':
+            line = f'<p>{line}</p>'
+        append(line)
+
+    if in_list:
+        append('</ul>')
 
     html = '\n'.join(result)
 
-    # Convert emojis to spans
-    emoji_pattern = r'([\U0001F300-\U0001F9FF]|[\u2600-\u26FF]|[\u2700-\u27BF])'
-    html = re.sub(emoji_pattern, r'<span class="emoji">\1</span>', html)
+    # Convert emojis to spans (isascii() is a constant-time flag check)
+    if not html.isascii():
+        html = _EMOJI_RE.sub(r'<span class="emoji">\g<0></span>', html)
 
     return html
 
+def page_title(markdown_text):
+    """Return the text of the first level-1 header in the markdown source."""
+    if markdown_text.startswith('# '):
+        start = 0
+    else:
+        start = markdown_text.find('\n# ') + 1
+        if not start:
+            return "FP-ASM"
+
+    end = markdown_text.find('\n', start)
+    if end == -1:
+        end = len(markdown_text)
+    return markdown_text[start + 2:end].strip()
+
 def create_index_page():
     """Create the main index page."""
     content = """
@@ -590,8 +713,64 @@ int main() {
 """
     return content
 
-def generate_html_docs():
-    """Generate HTML documentation from markdown files."""
+# Batches smaller than this convert faster serially than a process pool starts
+PARALLEL_MIN_BYTES = 512 * 1024
+
+def convert_all(markdown_texts):
+    """Convert several markdown documents, in parallel for large batches."""
+    workers = min(len(markdown_texts), os.cpu_count() or 1)
+    if workers < 2 or sum(map(len, markdown_texts)) < PARALLEL_MIN_BYTES:
+        return [convert_markdown_to_html(text) for text in markdown_texts]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(convert_markdown_to_html, markdown_texts))
+
+# Converted pages are cached by content hash so unchanged docs skip conversion
+CACHE_FILE = ".cache.json"
+CACHE_LIMIT = 64
+
+# Part of every cache key, so editing this generator invalidates the cache
+_GENERATOR_DIGEST = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).digest()
+
+# Every page depends on this generator as well as on its markdown source
+_GENERATOR_MTIME = os.stat(__file__).st_mtime_ns
+
+def content_hash(markdown_text):
+    """Return the cache key for a markdown document."""
+    h = hashlib.blake2b(_GENERATOR_DIGEST, digest_size=16)
+    h.update(markdown_text.encode('utf-8'))
+    return h.hexdigest()
+
+def load_cache(cache_path):
+    """Load the conversion cache, starting empty if it is missing or corrupt."""
+    try:
+        cache = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_cache(cache_path, cache):
+    """Write the conversion cache, dropping the least recently used entries."""
+    while len(cache) > CACHE_LIMIT:
+        del cache[next(iter(cache))]
+    cache_path.write_text(json.dumps(cache), encoding='utf-8')
+
+def write_file(path, text):
+    """Write text as UTF-8 straight to a file descriptor, bypassing io buffering."""
+    data = memoryview(text.encode('utf-8'))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def generate_html_docs(force=False):
+    """Generate HTML documentation from markdown files.
+
+    Pages that are already up to date are skipped unless `force` is set.
+    """
     print("[*] FP-ASM HTML Documentation Generator")
     print("=" * 60)
 
@@ -612,96 +791,81 @@ def generate_html_docs():
         "ACHIEVEMENT_SUMMARY.md"
     ]
 
-    converted = 0
+    # Shared stylesheet
+    write_file(output_dir / "styles.css", _CSS)
 
-    # Convert each markdown file
-    for md_file in md_files:
-        md_path = Path(md_file)
+    cache_path = output_dir / CACHE_FILE
+    cache = load_cache(cache_path)
+    converted = 0
 
-        if not md_path.exists():
+    # Source and output path of each page
+    paths = {
+        md_file: (Path(md_file), output_dir / (md_file[:-3] + '.html'))
+        for md_file in md_files
+    }
+
+    # Modification times of the pages already generated, from one directory scan
+    built = {
+        entry.name: entry.stat().st_mtime_ns
+        for entry in os.scandir(output_dir) if entry.is_file()
+    }
+
+    # Read each markdown file, reusing cached conversions of unchanged ones
+    titles = {}
+    digests = {}
+    pages = {}
+    pending = {}
+    for md_file, (md_path, html_path) in paths.items():
+        try:
+            source_mtime = md_path.stat().st_mtime_ns
+        except FileNotFoundError:
             print(f"[WARN] Skipping {md_file} (not found)")
             continue
 
-        print(f"[*] Converting {md_file}...", end=" ")
+        if not force and max(source_mtime, _GENERATOR_MTIME) <= built.get(html_path.name, -1):
+            print(f"[SKIP] {md_file} (up to date)")
+            continue
 
         # Read markdown
-        with open(md_path, 'r', encoding='utf-8') as f:
-            markdown_content = f.read()
-
-        # Convert to HTML
-        html_content = convert_markdown_to_html(markdown_content)
-
-        # Determine active page for navigation
-        active_flags = {
-            'active_index': '',
-            'active_readme': '',
-            'active_quick': '',
-            'active_api': '',
-            'active_complete': '',
-            'active_tier1': '',
-            'active_tier2': '',
-            'active_tier3': '',
-            'active_achievement': ''
-        }
-
-        if md_file == "README.md":
-            active_flags['active_readme'] = 'active'
-        elif md_file == "QUICK_START.md":
-            active_flags['active_quick'] = 'active'
-        elif md_file == "API_REFERENCE.md":
-            active_flags['active_api'] = 'active'
-        elif md_file == "COMPLETE_LIBRARY_REPORT.md":
-            active_flags['active_complete'] = 'active'
-        elif md_file == "TIER1_COMPLETENESS_REPORT.md":
-            active_flags['active_tier1'] = 'active'
-        elif md_file == "TIER2_COMPLETENESS_REPORT.md":
-            active_flags['active_tier2'] = 'active'
-        elif md_file == "TIER3_COMPLETENESS_REPORT.md":
-            active_flags['active_tier3'] = 'active'
-        elif md_file == "ACHIEVEMENT_SUMMARY.md":
-            active_flags['active_achievement'] = 'active'
-
-        # Get title from first h1
-        title_match = re.search(r'<h1>(.+?)</h1>', html_content)
-        title = title_match.group(1) if title_match else "FP-ASM"
-        title = re.sub(r'<[^>]+>', '', title)  # Strip HTML tags from title
+        markdown_content = md_path.read_text(encoding='utf-8')
 
-        # Generate final HTML
-        final_html = HTML_TEMPLATE.format(
-            title=title,
-            content=html_content,
-            **active_flags
-        )
+        titles[md_file] = page_title(markdown_content)
+        digest = digests[md_file] = content_hash(markdown_content)
+        entry = cache.get(md_file)
+        if entry and entry.get('hash') == digest:
+            pages[md_file] = entry['html']
+        else:
+            pending[md_file] = markdown_content
+
+    # Convert the rest to HTML
+    pages.update(zip(pending, convert_all(list(pending.values()))))
+
+    # Write each page
+    for md_file, digest in digests.items():
+        html_path = paths[md_file][1]
+        html_content = pages[md_file]
+
+        print(f"[*] Converting {md_file}...", end=" ")
+
+        cache.pop(md_file, None)
+        cache[md_file] = {'hash': digest, 'html': html_content}
 
-        # Fix markdown links to HTML links
-        final_html = final_html.replace('.md"', '.html"')
+        # Generate final HTML
+        final_html = render_page(titles[md_file], html_content, PAGE_KEYS.get(md_file, ''))
 
         # Write HTML file
-        html_path = output_dir / md_path.with_suffix('.html').name
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(final_html)
+        write_file(html_path, final_html)
 
         print(f"[OK] -> {html_path}")
         converted += 1
 
+    save_cache(cache_path, cache)
+
     # Create index.html
     print("[*] Creating index.html...", end=" ")
     index_content = create_index_page()
-    index_html = HTML_TEMPLATE.format(
-        title="Home",
-        content=index_content,
-        active_index='active',
-        active_readme='',
-        active_quick='',
-        active_api='',
-        active_complete='',
-        active_tier1='',
-        active_tier2='',
-        active_tier3='',
-        active_achievement=''
-    )
-    with open(output_dir / "index.html", 'w', encoding='utf-8') as f:
-        f.write(index_html)
+    index_html = render_page("Home", index_content, "index")
+    write_file(output_dir / "index.html", index_html)
     print("[OK]")
 
     print("\n" + "=" * 60)
@@ -711,4 +875,4 @@ def generate_html_docs():
     print("=" * 60)
 
 if __name__ == "__main__":
-    generate_html_docs()
+    generate_html_docs(force="--force" in sys.argv[1:])